@@ -0,0 +1,24 @@
+# fill the url_hash column for links created before it was added
+# run from the repository root after adding the column: python3 backfill_url_hash.py
+from tortoise import Tortoise, run_async
+from loguru import logger
+from urlvalidator import normalize_url, get_url_hash
+from main import Links, database_url
+
+
+async def backfill_url_hash():
+    await Tortoise.init(db_url=database_url, modules={"models": ["main"]})
+    updated_links_count = 0
+    for the_link in await Links.filter(url_hash__isnull=True):
+        try:
+            theurl_hash = get_url_hash(normalize_url(the_link.url))
+        except ValueError:
+            logger.warning(f"skipping {the_link.slug}: invalid url {the_link.url}")
+            continue
+        await Links.filter(slug=the_link.slug).update(url_hash=theurl_hash)
+        updated_links_count += 1
+    logger.info(f"updated {updated_links_count} links.")
+
+
+if __name__ == "__main__":
+    run_async(backfill_url_hash())
@@ -0,0 +1,57 @@
+# compare the old add_link url validation path with urlvalidator.normalize_url
+# run from the repository root: python3 benchmarks/bench_url_validation.py
+from timeit import timeit
+import ipaddress, re, sys, os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from urlvalidator import normalize_url
+
+try:
+    import validators
+except ImportError:
+    validators = None
+
+bench_urls: list = [
+    "example.com",
+    "https://www.example.com/some/path?query=1#fragment",
+    "http://sub.domain.example.org:8080/path",
+    "http://1.2.3.4/",
+    "http://[2001:db8::1]/",
+    "https://bücher.de/",
+    "not a url",
+]
+bench_loops: int = 20000
+
+
+def old_validation_path(url: str):
+    theurl = url if re.match(r"^https?://", url) else "http://" + url
+    if validators.url(theurl):
+        return theurl
+    try:
+        ipaddress.IPv4Address(theurl)
+        return theurl
+    except ipaddress.AddressValueError:
+        return None
+
+
+def new_validation_path(url: str):
+    try:
+        return normalize_url(url)
+    except ValueError:
+        return None
+
+
+def run_bench(func):
+    return timeit(lambda: [func(url) for url in bench_urls], number=bench_loops)
+
+
+if __name__ == "__main__":
+    total_calls = bench_loops * len(bench_urls)
+    new_time = run_bench(new_validation_path)
+    print(f"new: {new_time:.3f}s ({new_time / total_calls * 1e6:.2f}us per url)")
+    if validators is None:
+        print("old: skipped, validators is not installed")
+    else:
+        old_time = run_bench(old_validation_path)
+        print(f"old: {old_time:.3f}s ({old_time / total_calls * 1e6:.2f}us per url)")
+        print(f"speedup: {old_time / new_time:.2f}x")
@@ -21,13 +21,18 @@ from user_agents import parse as parse_user_agent
 from collections import Counter
 from plotly import graph_objects, io as plotlyio
 from contextlib import asynccontextmanager
+from urlvalidator import normalize_url, get_url_hash
 
 try:
     from config import database_url, port
 except:
     database_url: str = "sqlite://linksdb.sqlite"
     port: int = 8000
-import uvicorn, jinja2, pydantic, re, sys, os, qrcode, httpx, pytz, yaml, validators, ipaddress
+try:
+    from config import deduplicate_links
+except:
+    deduplicate_links: bool = False
+import uvicorn, jinja2, pydantic, sys, os, qrcode, httpx, pytz, yaml
 
 app_version: str = "2.0"
 min_slug_len: int = 4
@@ -54,6 +59,7 @@ logger.add(
 class Links(Model):
     slug = fields.CharField(max_length=max_slug_len, pk=True)
     url = fields.TextField()
+    url_hash = fields.CharField(max_length=64, index=True, null=True)
     views = fields.IntField()
     created_at = fields.DatetimeField(auto_now_add=True)
     last_db_change_at = fields.DatetimeField(auto_now=True)
@@ -169,6 +175,17 @@ async def check_if_valid_slug(slug: str):
 
 
 async def add_link(url: str, host, slug: Optional[str] = None):
+    theurl = is_valid_address(url)
+    theurl_hash = get_url_hash(theurl)
+    if deduplicate_links and not slug:
+        existing_link = await Links.filter(url_hash=theurl_hash).first()
+        if existing_link:
+            return {
+                "slug": existing_link.slug,
+                "url": existing_link.url,
+                "link": f"{host}/{existing_link.slug}",
+                "qr_code": f"{host}/{existing_link.slug}/qr",
+            }
     theslug = slug or await gen_valid_url_slug()
     theslug = theslug.lower()
     checkslugvalidlist = check_if_slug_is_invalid_from_invalid_list(slug=theslug)
@@ -176,9 +193,7 @@ async def add_link(url: str, host, slug: Optional[str] = None):
         theslug = await gen_valid_url_slug()
         theslug = theslug.lower()
     await check_if_valid_slug(slug=theslug)
-    theurl = url if re.match(r"^https?://", url) else "http://" + url
-    is_valid_address(theurl)
-    await Links.create(slug=theslug, url=theurl, views=0)
+    await Links.create(slug=theslug, url=theurl, url_hash=theurl_hash, views=0)
     return {
         "slug": theslug,
         "url": theurl,
@@ -277,12 +292,9 @@ async def get_links_count():
 
 
 def is_valid_address(address):
-    if validators.url(address):
-        return True
     try:
-        ipaddress.IPv4Address(address)
-        return True
-    except ipaddress.AddressValueError:
+        return normalize_url(address)
+    except ValueError:
         raise HTTPException(status_code=400, detail=f"invalid address")
 
 
@@ -664,4 +676,6 @@ register_tortoise(
     modules={"models": [__name__]},
     generate_schemas=True,
 )
-uvicorn.run(app=app, host="0.0.0.0", port=port)
+
+if __name__ == "__main__":
+    uvicorn.run(app=app, host="0.0.0.0", port=port)
@@ -0,0 +1,82 @@
+import sys, os, asyncio, pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tortoise import Tortoise, connections
+from fastapi.exceptions import HTTPException
+from urlvalidator import normalize_url, get_url_hash
+import main
+
+test_host: str = "short.test"
+
+
+def run_with_db(test_func):
+    async def runner():
+        await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["main"]})
+        await Tortoise.generate_schemas()
+        try:
+            return await test_func()
+        finally:
+            await connections.close_all()
+
+    return asyncio.run(runner())
+
+
+def test_add_link_stores_url_hash(monkeypatch):
+    monkeypatch.setattr(main, "deduplicate_links", False)
+
+    async def the_test():
+        the_link = await main.add_link(url="EXAMPLE.com", host=test_host)
+        link_db = await main.Links.get(slug=the_link["slug"])
+        assert link_db.url == "http://example.com/"
+        assert link_db.url_hash == get_url_hash(normalize_url("example.com"))
+
+    run_with_db(the_test)
+
+
+def test_add_link_deduplicates(monkeypatch):
+    monkeypatch.setattr(main, "deduplicate_links", True)
+
+    async def the_test():
+        first_link = await main.add_link(url="http://example.com/", host=test_host)
+        second_link = await main.add_link(url="EXAMPLE.com", host=test_host)
+        assert second_link == first_link
+        assert await main.Links.all().count() == 1
+
+    run_with_db(the_test)
+
+
+def test_add_link_without_deduplication(monkeypatch):
+    monkeypatch.setattr(main, "deduplicate_links", False)
+
+    async def the_test():
+        first_link = await main.add_link(url="example.com", host=test_host)
+        second_link = await main.add_link(url="example.com", host=test_host)
+        assert second_link["slug"] != first_link["slug"]
+        assert await main.Links.all().count() == 2
+
+    run_with_db(the_test)
+
+
+def test_add_link_custom_slug_skips_deduplication(monkeypatch):
+    monkeypatch.setattr(main, "deduplicate_links", True)
+
+    async def the_test():
+        first_link = await main.add_link(url="example.com", host=test_host)
+        custom_link = await main.add_link(
+            url="example.com", host=test_host, slug="myslug"
+        )
+        assert custom_link["slug"] == "myslug"
+        assert custom_link["slug"] != first_link["slug"]
+        assert await main.Links.all().count() == 2
+
+    run_with_db(the_test)
+
+
+def test_add_link_invalid_url():
+    async def the_test():
+        with pytest.raises(HTTPException) as the_error:
+            await main.add_link(url="http://x.com\\@evil.com", host=test_host)
+        assert the_error.value.status_code == 400
+        assert await main.Links.all().count() == 0
+
+    run_with_db(the_test)
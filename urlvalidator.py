@@ -0,0 +1,82 @@
+from urllib.parse import urlsplit, urlunsplit
+from hashlib import sha256
+import ipaddress, re, idna
+
+allowed_url_schemes: tuple = ("http", "https")
+default_url_scheme: str = "http"
+default_ports: dict = {"http": 80, "https": 443}
+max_hostname_len: int = 253
+
+url_scheme_regex = re.compile(r"^([a-z][a-z0-9+.-]*)://", re.IGNORECASE)
+invalid_url_chars_regex = re.compile(r"[\x00-\x20\x7f]")
+bare_ipv6_url_regex = re.compile(
+    r"^([0-9a-f]*:[0-9a-f:.]*:[0-9a-f:.]*)([/?#].*)?$", re.IGNORECASE
+)
+userinfo_regex = re.compile(r"^[a-z0-9\-._~!$&'()*+,;=:%]*$", re.IGNORECASE)
+ipv4_like_hostname_regex = re.compile(r"^[0-9.]+$")
+domain_regex = re.compile(
+    r"^(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+"
+    r"(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})$"
+)
+
+
+def normalize_hostname(hostname: str):
+    """Return the canonical hostname, raise ValueError if it is invalid."""
+    if ":" in hostname:
+        try:
+            return f"[{ipaddress.IPv6Address(hostname).compressed}]"
+        except ValueError:
+            raise ValueError(f"invalid ipv6 address {hostname}")
+    thehostname = hostname[:-1] if hostname.endswith(".") else hostname
+    if ipv4_like_hostname_regex.match(thehostname):
+        try:
+            return ipaddress.IPv4Address(thehostname).compressed
+        except ValueError:
+            raise ValueError(f"invalid ipv4 address {hostname}")
+    try:
+        thehostname = idna.encode(thehostname, uts46=True).decode("ascii")
+    except idna.IDNAError:
+        raise ValueError(f"invalid hostname {hostname}")
+    if len(thehostname) > max_hostname_len or not domain_regex.match(thehostname):
+        raise ValueError(f"invalid hostname {hostname}")
+    return thehostname
+
+
+def normalize_url(url: str):
+    """Return the canonical http(s) url, raise ValueError if it is invalid."""
+    theurl = url.strip()
+    if not theurl or invalid_url_chars_regex.search(theurl):
+        raise ValueError("invalid url")
+    scheme_match = url_scheme_regex.match(theurl)
+    if scheme_match is None:
+        bare_ipv6_match = bare_ipv6_url_regex.match(theurl)
+        if bare_ipv6_match:
+            theurl = f"[{bare_ipv6_match.group(1)}]{bare_ipv6_match.group(2) or ''}"
+        theurl = f"{default_url_scheme}://{theurl}"
+    elif scheme_match.group(1).lower() not in allowed_url_schemes:
+        raise ValueError(f"invalid url scheme {scheme_match.group(1)}")
+    url_parts = urlsplit(theurl)
+    thescheme = url_parts.scheme.lower()
+    if not url_parts.hostname:
+        raise ValueError("invalid url: missing hostname")
+    userinfo, _, _ = url_parts.netloc.rpartition("@")
+    if not userinfo_regex.match(userinfo):
+        raise ValueError("invalid url: invalid userinfo")
+    thehostname = normalize_hostname(url_parts.hostname)
+    try:
+        theport = url_parts.port
+    except ValueError:
+        raise ValueError("invalid url: invalid port")
+    if theport == 0:
+        raise ValueError("invalid url: invalid port")
+    thenetloc = f"{userinfo}@{thehostname}" if userinfo else thehostname
+    if theport is not None and theport != default_ports[thescheme]:
+        thenetloc = f"{thenetloc}:{theport}"
+    thepath = url_parts.path or "/"
+    return urlunsplit(
+        (thescheme, thenetloc, thepath, url_parts.query, url_parts.fragment)
+    )
+
+
+def get_url_hash(url: str):
+    return sha256(url.encode("utf-8")).hexdigest()